@@ -0,0 +1,39 @@
+from django.contrib import admin
+from django.db.models import CharField
+from django.db.models.functions import Cast, TruncSecond
+
+from .models import TUser
+
+
+@admin.register(TUser)
+class TUserAdmin(admin.ModelAdmin):
+    list_display = ('id', 'username', 'email', 'name', 'phone', 'is_active', 'created_at_display')
+    list_filter = ('is_active', 'created_at')
+    search_fields = ('username', 'email', 'name')
+    readonly_fields = ('created_at', 'updated_at')
+    list_per_page = 50
+    # No FK columns yet; extend this when relations are added so the
+    # changelist JOINs instead of issuing one query per row.
+    list_select_related = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = getattr(request, 'resolver_match', None)
+        if match is None or match.url_name != 'users_tuser_changelist':
+            # Change/delete views render fields outside list_display
+            # (address, updated_at); deferring those would cost an extra
+            # query per access, so only the changelist gets trimmed.
+            return queryset
+        # The changelist renders only list_display columns; skip the unused
+        # address TextField and updated_at to shrink each fetched row. The
+        # created_at string is formatted by the database so list rendering
+        # does not call strftime per row.
+        return queryset.only(
+            'id', 'username', 'email', 'name', 'phone', 'is_active', 'created_at',
+        ).annotate(
+            created_fmt=Cast(TruncSecond('created_at'), output_field=CharField()),
+        )
+
+    @admin.display(description='created at', ordering='created_at')
+    def created_at_display(self, obj):
+        return obj.created_fmt
@@ -0,0 +1,27 @@
+import sys
+
+from django.apps import AppConfig
+
+
+class UsersConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'users'
+
+    def ready(self):
+        # Only wire up shutdown hooks when running as a server process.
+        # Management commands like migrate, shell or collectstatic should
+        # not pay the signal-handler and atexit setup cost.
+        argv0 = sys.argv[0] if sys.argv else ''
+        is_server = (
+            'runserver' in sys.argv
+            or 'gunicorn' in argv0
+            or 'uwsgi' in argv0
+            or 'daphne' in argv0
+        )
+        if is_server:
+            self._initialize_shutdown_hooks()
+
+    def _initialize_shutdown_hooks(self):
+        from .shutdown_hooks import initialize_shutdown_hooks
+
+        initialize_shutdown_hooks()
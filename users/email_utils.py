@@ -0,0 +1,159 @@
+"""Email helpers built on Django's email framework (SMTP details in settings)."""
+import logging
+import queue
+
+from django.conf import settings
+from django.core.mail import EmailMessage, EmailMultiAlternatives, get_connection
+from django.template.loader import get_template
+
+logger = logging.getLogger(__name__)
+
+# Loaded once at import: get_template caches the compiled template, so every
+# send only pays for rendering, never for parse + compile.
+_WELCOME_TXT = get_template('emails/welcome.txt')
+_WELCOME_HTML = get_template('emails/welcome.html')
+_NOTIFICATION_TXT = get_template('emails/notification.txt')
+_NOTIFICATION_HTML = get_template('emails/notification.html')
+
+# Number of concurrent SMTP connections for bulk sends. Providers allow few
+# parallel sessions (Gmail ~15, Zoho 5-10), so keep this small.
+BULK_CONCURRENCY = 5
+
+# Sub-batch size for bulk sends; keeps each send_messages() call well under
+# typical provider per-connection limits.
+BULK_CHUNK_SIZE = 50
+
+# Abort a bulk send once this fraction of a chunk fails -- repeated failures
+# usually mean the provider is rate limiting us and retrying makes it worse.
+BULK_FAILURE_THRESHOLD = 1 / 3
+
+
+class SMTPConnectionPool:
+    """Pool of persistent SMTP connections for concurrent bulk sends.
+
+    SMTP is sequential per connection, so concurrency has to come from
+    multiple connections: each worker thread checks one out, sends over it
+    and returns it. Sending is I/O bound, which makes threads the right
+    tool here.
+    """
+
+    def __init__(self, size=BULK_CONCURRENCY):
+        self._connections = queue.Queue(maxsize=size)
+        for _ in range(size):
+            # fail_silently: one undeliverable recipient must not abort
+            # the whole batch draining through the pool.
+            connection = get_connection(fail_silently=True)
+            connection.open()
+            self._connections.put(connection)
+
+    def send(self, message):
+        """Send one message over a checked-out connection; returns the count sent."""
+        connection = self._connections.get()
+        try:
+            message.connection = connection
+            try:
+                return connection.send_messages([message]) or 0
+            except Exception as exc:
+                logger.error(f"Failed to send to {message.to}: {exc}")
+                return 0
+        finally:
+            self._connections.put(connection)
+
+    def close_all(self):
+        """Drain the pool and close every connection. Safe to call twice."""
+        while True:
+            try:
+                connection = self._connections.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                connection.close()
+            except Exception as exc:
+                logger.warning(f"Error closing pooled SMTP connection: {exc}")
+
+
+def send_user_welcome_email(user, connection=None):
+    """Send the welcome email (text + HTML) to a newly registered user."""
+    context = {'display_name': user.name or user.username}
+    email = EmailMultiAlternatives(
+        'Welcome!', _WELCOME_TXT.render(context),
+        settings.DEFAULT_FROM_EMAIL, [user.email], connection=connection,
+    )
+    email.attach_alternative(_WELCOME_HTML.render(context), 'text/html')
+    try:
+        email.send()
+        return True
+    except Exception as exc:
+        logger.error(f"Failed to send welcome email to {user.email}: {exc}")
+        return False
+
+
+def send_user_notification_email(user, subject, message, connection=None):
+    """Send a notification email (text + HTML) to a single user."""
+    context = {'display_name': user.name or user.username, 'message': message}
+    email = EmailMultiAlternatives(
+        subject, _NOTIFICATION_TXT.render(context),
+        settings.DEFAULT_FROM_EMAIL, [user.email], connection=connection,
+    )
+    email.attach_alternative(_NOTIFICATION_HTML.render(context), 'text/html')
+    try:
+        email.send()
+        return True
+    except Exception as exc:
+        logger.error(f"Failed to send notification email to {user.email}: {exc}")
+        return False
+
+
+def send_bulk_email(subject, message, recipient_list, connection=None):
+    """Send one message per recipient over a single SMTP connection.
+
+    Opening a connection per email pays the TLS + AUTH handshake for every
+    message, which dominates bulk-send time. Instead one connection is
+    opened (or an already-open one is passed in) and reused for the whole
+    batch via ``connection.send_messages()``. Each recipient gets their own
+    message so addresses are never leaked through a shared To: header.
+
+    Returns the number of messages sent.
+    """
+    if not recipient_list:
+        return 0
+
+    owns_connection = connection is None
+    if owns_connection:
+        # fail_silently makes send_messages() return the number actually
+        # delivered instead of raising on the first bad recipient, which
+        # is what gives the abort threshold below something to measure.
+        connection = get_connection(fail_silently=True)
+        connection.open()
+
+    sent = 0
+    try:
+        for start in range(0, len(recipient_list), BULK_CHUNK_SIZE):
+            chunk = recipient_list[start:start + BULK_CHUNK_SIZE]
+            messages = [
+                EmailMessage(
+                    subject, message, settings.DEFAULT_FROM_EMAIL, [recipient],
+                    connection=connection,
+                )
+                for recipient in chunk
+            ]
+            try:
+                delivered = connection.send_messages(messages) or 0
+            except Exception as exc:
+                # Caller-supplied connections may not be fail-silent;
+                # treat a raising chunk as fully failed rather than
+                # aborting the helper with an unhandled exception.
+                logger.error(f"Bulk send chunk failed: {exc}")
+                delivered = 0
+            sent += delivered
+            failed = len(chunk) - delivered
+            if failed >= len(chunk) * BULK_FAILURE_THRESHOLD:
+                logger.error(
+                    f"Aborting bulk send after {failed}/{len(chunk)} failures "
+                    f"in one chunk ({sent} sent so far)"
+                )
+                break
+    finally:
+        if owns_connection:
+            connection.close()
+    return sent
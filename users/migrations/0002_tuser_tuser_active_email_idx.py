@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 07:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tuser',
+            index=models.Index(fields=['is_active', 'email'], name='tuser_active_email_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+import logging
+
+from django.db import models
+
+logger = logging.getLogger(__name__)
+
+
+class TUser(models.Model):
+    """Application user stored in the ``t_users`` table."""
+
+    username = models.CharField(max_length=150, unique=True)
+    email = models.EmailField(max_length=254, blank=True, null=True)
+    name = models.CharField(max_length=255, blank=True)
+    phone = models.CharField(max_length=20, blank=True)
+    address = models.TextField(blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 't_users'
+        ordering = ['-created_at']
+        indexes = [
+            # Serves the bulk-notification query (filter on is_active, read
+            # email) from an index-only scan.
+            models.Index(fields=['is_active', 'email'], name='tuser_active_email_idx'),
+        ]
+
+    def __str__(self):
+        return self.username
+
+    # Note: bulk_create()/bulk_update() intentionally bypass save() and its
+    # logging -- that is the right behavior for bulk paths, which should not
+    # pay per-row Python work.
+    def save(self, *args, **kwargs):
+        if logger.isEnabledFor(logging.INFO):
+            if self.pk is None:
+                logger.info("Creating new user: %s", self.username)
+            else:
+                logger.info("Updating user: %s", self.username)
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Deleting user: %s", self.username)
+        super().delete(*args, **kwargs)
@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from .models import TUser
+
+
+class TUserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TUser
+        fields = [
+            'id', 'username', 'email', 'name', 'phone', 'address',
+            'is_active', 'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+    def validate_email(self, value):
+        # str.lower() already fast-paths ASCII internally; measured faster
+        # than an encode/translate/decode round-trip.
+        if value:
+            value = value.lower()
+        return value
@@ -0,0 +1,141 @@
+"""
+Graceful shutdown hook management.
+
+Provides a JVM ``Runtime.addShutdownHook()``-style mechanism so cleanup
+routines (database, cache and Celery connections) run when the server
+process receives SIGTERM/SIGINT or exits normally.
+"""
+import atexit
+import heapq
+import itertools
+import logging
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class ShutdownHookManager:
+    """Singleton that collects shutdown hooks and runs them in priority order."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            # State lives on the instance, not the class, so subclasses or
+            # re-created "singletons" can never share a stale hook list.
+            # Heap of (priority, insertion_order, hook) -- the insertion
+            # counter keeps equal-priority hooks in registration order and
+            # avoids comparing the hook dicts themselves.
+            instance._hooks = []
+            instance._counter = itertools.count()
+            instance._lock = threading.Lock()
+            instance._initialized = False
+            instance._is_shutting_down = False
+            cls._instance = instance
+        return cls._instance
+
+    def initialize(self):
+        """Install the signal handlers and the atexit fallback."""
+        if self._initialized:
+            return
+        signal.signal(signal.SIGTERM, self._signal_handler)
+        signal.signal(signal.SIGINT, self._signal_handler)
+        atexit.register(self._execute_hooks)
+        self._initialized = True
+        logger.info("Shutdown hook manager initialized")
+
+    def register_hook(self, func, name=None, priority=100):
+        """Register a callable to run at shutdown.
+
+        Hooks run in ascending priority order: lower priority values run
+        first. Hooks sharing a priority form a tier and may run
+        concurrently, so they must not depend on each other.
+        """
+        with self._lock:
+            heapq.heappush(self._hooks, (priority, next(self._counter), {
+                'func': func,
+                'name': name or func.__name__,
+                'priority': priority,
+            }))
+        logger.debug(f"Registered shutdown hook: {name or func.__name__} (priority={priority})")
+
+    def _signal_handler(self, signum, frame):
+        signame = signal.Signals(signum).name
+        logger.info(f"Received {signame}, running shutdown hooks")
+        self._execute_hooks()
+        sys.exit(0)
+
+    def _execute_hooks(self):
+        with self._lock:
+            if self._is_shutting_down:
+                return
+            self._is_shutting_down = True
+            ordered = []
+            while self._hooks:
+                ordered.append(heapq.heappop(self._hooks)[2])
+        # Tiers (equal priority) run concurrently -- the cleanup work is
+        # I/O bound (closing sockets) so overlapping it shortens the
+        # shutdown grace window. Tiers themselves stay serialized.
+        for _, group in itertools.groupby(ordered, key=lambda h: h['priority']):
+            tier = list(group)
+            if len(tier) == 1:
+                self._run_hook(tier[0])
+            else:
+                with ThreadPoolExecutor(max_workers=len(tier)) as executor:
+                    list(executor.map(self._run_hook, tier))
+        logger.info("All shutdown hooks executed")
+
+    def _run_hook(self, hook):
+        try:
+            logger.info(f"Executing shutdown hook: {hook['name']}")
+            hook['func']()
+        except Exception as exc:
+            logger.error(f"Shutdown hook {hook['name']} failed: {exc}")
+
+
+_manager = ShutdownHookManager()
+
+
+def register_shutdown_hook(func, name=None, priority=100):
+    """Module-level convenience wrapper around the singleton manager."""
+    _manager.register_hook(func, name=name, priority=priority)
+
+
+def close_database_connections():
+    """Close all open database connections."""
+    from django.db import connections
+
+    for conn in connections.all():
+        conn.close()
+
+
+def cleanup_cache_connections():
+    """Close cache backend connections that expose a close() method."""
+    from django.core.cache import caches
+
+    for cache in caches.all(initialized_only=True):
+        close = getattr(cache, 'close', None)
+        if close is not None:
+            close()
+
+
+def cleanup_celery_connections():
+    """Release the Celery broker connection pool."""
+    try:
+        from config.celery import app
+
+        app.close()
+    except Exception as exc:
+        logger.warning(f"Could not close Celery connections: {exc}")
+
+
+def initialize_shutdown_hooks():
+    """Initialize the manager and register the default cleanup hooks."""
+    _manager.initialize()
+    register_shutdown_hook(close_database_connections, priority=10)
+    register_shutdown_hook(cleanup_cache_connections, priority=20)
+    register_shutdown_hook(cleanup_celery_connections, priority=20)
@@ -0,0 +1,101 @@
+"""Background and scheduled tasks (Celery)."""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.db.models import Count, Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .email_utils import BULK_CONCURRENCY, SMTPConnectionPool, send_user_welcome_email
+from .models import TUser
+
+logger = logging.getLogger(__name__)
+
+# Filter keys accepted from bulk-notification callers. Unpacking arbitrary
+# task arguments into filter() would allow any ORM lookup and produce
+# queries no index can serve.
+ALLOWED_NOTIFICATION_FILTERS = {'is_active', 'created_at__gte', 'created_at__lte'}
+
+
+@shared_task
+def send_welcome_email_task(user_id):
+    """Send the welcome email for a newly registered user."""
+    try:
+        # The welcome email only needs these columns; skip fetching the
+        # rest of the row (notably the address TextField).
+        user = TUser.objects.only('email', 'username', 'name').get(id=user_id)
+    except TUser.DoesNotExist:
+        logger.warning(f"User {user_id} no longer exists, skipping welcome email")
+        return False
+    return send_user_welcome_email(user)
+
+
+@shared_task
+def send_bulk_notification(subject, message, user_filter=None):
+    """Send a notification email to every user matching ``user_filter``."""
+    filters = {
+        key: value
+        for key, value in (user_filter or {}).items()
+        if key in ALLOWED_NOTIFICATION_FILTERS
+    }
+    # Fetch only the email column: values_list() skips model instantiation
+    # and iterator() streams rows instead of caching the whole result set.
+    recipients = (
+        TUser.objects.filter(**filters)
+        .exclude(email='')
+        .exclude(email__isnull=True)
+        .values_list('email', flat=True)
+        .iterator(chunk_size=2000)
+    )
+
+    # The pool lives for one task invocation and is closed in the finally
+    # block below; registering it as a shutdown hook would leak one dead
+    # pool per invocation on the hook heap of a long-lived worker.
+    pool = SMTPConnectionPool(size=BULK_CONCURRENCY)
+    try:
+        with ThreadPoolExecutor(max_workers=BULK_CONCURRENCY) as executor:
+            futures = [
+                executor.submit(
+                    pool.send,
+                    EmailMessage(subject, message, settings.DEFAULT_FROM_EMAIL, [recipient]),
+                )
+                for recipient in recipients
+            ]
+            sent = sum(future.result() for future in futures)
+    finally:
+        pool.close_all()
+    if not futures:
+        logger.info("No recipients matched the filter, nothing to send")
+        return 0
+    logger.info(f"Bulk notification sent to {sent} of {len(futures)} recipients")
+    return sent
+
+
+@shared_task
+def cleanup_inactive_users():
+    """Scheduled task: report users that have been deactivated."""
+    # Count in the database only; if row iteration is ever needed here,
+    # use .iterator(chunk_size=2000) to avoid caching the whole result set.
+    count = TUser.objects.filter(is_active=False).count()
+    logger.info(f"Found {count} inactive users")
+    return count
+
+
+@shared_task
+def generate_daily_report():
+    """Scheduled task: log a daily summary of the user table."""
+    today = timezone.now().date()
+    stats = TUser.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+        inactive=Count('id', filter=Q(is_active=False)),
+        new_today=Count('id', filter=Q(created_at__date=today)),
+    )
+    report = render_to_string(
+        'reports/daily.txt', {'today': today, 'stats': stats}
+    ).rstrip()
+    logger.info(report)
+    return report
@@ -0,0 +1,154 @@
+"""Tests for the bulk API endpoints, email send paths and shutdown hooks."""
+from django.core import mail
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .email_utils import BULK_CHUNK_SIZE, SMTPConnectionPool, send_bulk_email
+from .models import TUser
+from .shutdown_hooks import ShutdownHookManager
+from .tasks import send_bulk_notification
+
+LOCMEM_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+
+class BulkUserApiTests(APITestCase):
+    def test_bulk_create(self):
+        payload = [
+            {'username': 'ada', 'email': 'ADA@Example.com'},
+            {'username': 'bob'},
+        ]
+        response = self.client.post(reverse('tuser-bulk'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(TUser.objects.count(), 2)
+        self.assertEqual(TUser.objects.get(username='ada').email, 'ada@example.com')
+
+    def test_bulk_create_counts_only_new_rows(self):
+        # Duplicates within one payload are skipped by ignore_conflicts
+        # and must not be reported as created.
+        payload = [{'username': 'ada'}, {'username': 'ada'}]
+        response = self.client.post(reverse('tuser-bulk'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(TUser.objects.count(), 1)
+
+    def test_bulk_update_accepts_string_ids(self):
+        user = TUser.objects.create(username='ada')
+        payload = [{'id': str(user.id), 'name': 'Ada Lovelace'}]
+        response = self.client.patch(reverse('tuser-bulk-edit'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 1)
+        user.refresh_from_db()
+        self.assertEqual(user.name, 'Ada Lovelace')
+
+    def test_bulk_update_rejects_non_numeric_ids(self):
+        payload = [{'id': 'abc', 'name': 'x'}]
+        response = self.client.patch(reverse('tuser-bulk-edit'), payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update_requires_ids(self):
+        response = self.client.patch(
+            reverse('tuser-bulk-edit'), [{'name': 'x'}], format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class _FailingConnection:
+    """Connection stub whose sends all fail, for the abort threshold."""
+
+    def __init__(self):
+        self.chunks = 0
+
+    def send_messages(self, messages):
+        self.chunks += 1
+        return 0
+
+
+@override_settings(EMAIL_BACKEND=LOCMEM_BACKEND)
+class SendBulkEmailTests(TestCase):
+    def test_one_message_per_recipient(self):
+        recipients = ['a@example.com', 'b@example.com', 'c@example.com']
+        sent = send_bulk_email('Subject', 'Body', recipients)
+        self.assertEqual(sent, 3)
+        self.assertEqual(len(mail.outbox), 3)
+        for message, recipient in zip(mail.outbox, recipients):
+            self.assertEqual(message.to, [recipient])
+
+    def test_aborts_after_failing_chunk(self):
+        recipients = [f'user{i}@example.com' for i in range(BULK_CHUNK_SIZE * 3)]
+        connection = _FailingConnection()
+        sent = send_bulk_email('Subject', 'Body', recipients, connection=connection)
+        self.assertEqual(sent, 0)
+        self.assertEqual(connection.chunks, 1)
+
+    def test_pool_send(self):
+        pool = SMTPConnectionPool(size=2)
+        try:
+            message = mail.EmailMessage('Subject', 'Body', to=['a@example.com'])
+            self.assertEqual(pool.send(message), 1)
+            self.assertEqual(len(mail.outbox), 1)
+        finally:
+            pool.close_all()
+
+
+@override_settings(EMAIL_BACKEND=LOCMEM_BACKEND)
+class SendBulkNotificationTests(TestCase):
+    def test_sends_to_active_users_and_drops_unknown_filters(self):
+        TUser.objects.create(username='ada', email='ada@example.com')
+        TUser.objects.create(username='bob', email='bob@example.com')
+        TUser.objects.create(username='noemail')
+        TUser.objects.create(username='gone', email='gone@example.com', is_active=False)
+        sent = send_bulk_notification(
+            'Subject', 'Body', {'is_active': True, 'username': 'ada'}
+        )
+        self.assertEqual(sent, 2)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ['ada@example.com', 'bob@example.com'],
+        )
+
+
+class ShutdownHookManagerTests(SimpleTestCase):
+    def setUp(self):
+        self._saved_instance = ShutdownHookManager._instance
+        ShutdownHookManager._instance = None
+        self.manager = ShutdownHookManager()
+
+    def tearDown(self):
+        ShutdownHookManager._instance = self._saved_instance
+
+    def test_hooks_run_in_priority_order(self):
+        ran = []
+        self.manager.register_hook(lambda: ran.append('second'), name='second', priority=20)
+        self.manager.register_hook(lambda: ran.append('first'), name='first', priority=10)
+        self.manager._execute_hooks()
+        self.assertEqual(ran, ['first', 'second'])
+
+    def test_equal_priority_tier_all_run(self):
+        ran = []
+        self.manager.register_hook(lambda: ran.append('first'), name='first', priority=10)
+        self.manager.register_hook(lambda: ran.append('a'), name='a', priority=20)
+        self.manager.register_hook(lambda: ran.append('b'), name='b', priority=20)
+        self.manager._execute_hooks()
+        self.assertEqual(ran[0], 'first')
+        self.assertEqual(sorted(ran[1:]), ['a', 'b'])
+
+    def test_execute_hooks_runs_once(self):
+        ran = []
+        self.manager.register_hook(lambda: ran.append('hook'), name='hook')
+        self.manager._execute_hooks()
+        self.manager._execute_hooks()
+        self.assertEqual(ran, ['hook'])
+
+    def test_failing_hook_does_not_block_others(self):
+        ran = []
+
+        def broken():
+            raise RuntimeError('boom')
+
+        self.manager.register_hook(broken, name='broken', priority=10)
+        self.manager.register_hook(lambda: ran.append('after'), name='after', priority=20)
+        self.manager._execute_hooks()
+        self.assertEqual(ran, ['after'])
@@ -0,0 +1,8 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import TUserViewSet
+
+router = DefaultRouter()
+router.register(r'users', TUserViewSet, basename='tuser')
+
+urlpatterns = router.urls